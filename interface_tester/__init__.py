@@ -3,12 +3,22 @@
 import pytest
 
 from interface_tester.interface_test import Tester
-from interface_tester.plugin import InterfaceTester
+from interface_tester.plugin import InterfaceTester, _SessionCache
 from interface_tester.schema_base import DataBagSchema
 
 __all__ = ["Tester", "InterfaceTester", "DataBagSchema"]
 
 
+@pytest.fixture(scope="session")
+def interface_tester_session_cache():
+    """Session-scoped cache sharing git clones and gathered specs between all testers."""
+    cache = _SessionCache()
+    yield cache
+    cache.cleanup()
+
+
 @pytest.fixture(scope="function")
-def interface_tester():
-    yield InterfaceTester()
+def interface_tester(interface_tester_session_cache):
+    tester = InterfaceTester()
+    tester._session_cache = interface_tester_session_cache
+    yield tester
@@ -3,12 +3,12 @@
 import dataclasses
 import inspect
 import logging
-import operator
 import re
+import threading
 import typing
 from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Callable, List, Literal, Optional, Union
+from typing import Any, Callable, List, Literal, Optional, Tuple, Union
 
 import pydantic
 from ops.testing import CharmType
@@ -29,6 +29,19 @@ if typing.TYPE_CHECKING:
 
 INTF_NAME_AND_VERSION_REGEX = re.compile(r"/interfaces/(\w+)/v(\d+)/")
 
+# State is a frozen dataclass, so a single empty instance can be shared by all tests
+# that don't provide a state_template.
+_EMPTY_STATE = State()
+
+# suffix -> scenario event constructor, for dispatching relation event strings.
+_RELATION_EVENT_CONSTRUCTORS = {
+    "changed": CharmEvents.relation_changed,
+    "departed": CharmEvents.relation_departed,
+    "broken": CharmEvents.relation_broken,
+    "joined": CharmEvents.relation_joined,
+    "created": CharmEvents.relation_created,
+}
+
 logger = logging.getLogger(__name__)
 
 _has_pydantic_v1 = pydantic.version.VERSION.split(".") <= ["2"]
@@ -122,13 +135,24 @@ def check_test_case_validator_signature(fn: Callable):
         )
 
 
-_TESTER_CTX: Optional[_InterfaceTestContext] = None
+class _TesterState(threading.local):
+    """Per-thread tester state: the active context and the bound Tester instance.
+
+    Keeping this thread-local (instead of module-global) allows independent test cases to
+    run concurrently in separate threads.
+    """
+
+    ctx: Optional[_InterfaceTestContext] = None
+    tester: Optional["Tester"] = None
+
+
+_TESTER_STATE = _TesterState()
+_SCENARIO_RUN_LOCK = threading.Lock()
 
 
 @contextmanager
 def tester_context(ctx: _InterfaceTestContext):
-    global _TESTER_CTX
-    _TESTER_CTX = ctx
+    _TESTER_STATE.ctx = ctx
 
     try:
         yield
@@ -138,7 +162,7 @@ def tester_context(ctx: _InterfaceTestContext):
         if tester:
             tester._detach()
 
-        _TESTER_CTX = None
+        _TESTER_STATE.ctx = None
         raise
 
     tester = Tester.__instance__
@@ -150,7 +174,7 @@ def tester_context(ctx: _InterfaceTestContext):
         tester._finalize()
     finally:
         tester._detach()
-        _TESTER_CTX = None
+        _TESTER_STATE.ctx = None
 
     if Tester.__instance__:
         raise RuntimeError("cleanup failed, tester instance still bound")
@@ -172,9 +196,23 @@ class NoSchemaError(InvalidTesterRunError):
     """Raised when schemas cannot be validated because there is no schema."""
 
 
-class Tester:
-    __instance__ = None
+class _TesterMeta(type):
+    """Routes ``Tester.__instance__`` to the per-thread state.
+
+    This preserves the class-attribute API while making the singleton thread-local, so that
+    each worker thread gets its own Tester binding.
+    """
+
+    @property
+    def __instance__(cls) -> Optional["Tester"]:
+        return _TESTER_STATE.tester
+
+    @__instance__.setter
+    def __instance__(cls, value: Optional["Tester"]):
+        _TESTER_STATE.tester = value
 
+
+class Tester(metaclass=_TesterMeta):
     def __init__(self, state_in: Optional[State] = None, name: Optional[str] = None):
         """Core interface test specification tool.
 
@@ -251,7 +289,7 @@ class Tester:
         When called from an interface test scope, is guaranteed(^tm) to return
         ``_InterfaceTestContext``.
         """
-        return _TESTER_CTX
+        return _TESTER_STATE.ctx
 
     def run(self, event: Union[str, _Event]) -> State:
         """Simulate the emission on an event in the initial state you passed to the initializer.
@@ -368,7 +406,7 @@ class Tester:
         Tester.__instance__ = None
 
     def _run(self, event: Union[str, _Event]):
-        logger.debug("running %s" % event)
+        logger.debug("running %s", event)
         self._has_run = True
 
         # this is the input state as specified by the interface tests writer. It can
@@ -380,26 +418,25 @@ class Tester:
         # requires to function properly. Consider it part of the mocking. For example:
         # some required config, a "happy" status, network information, OTHER relations.
         # Typically, should NOT touch the relation that this interface test is about
-        #  -> so we overwrite and warn on conflict: state_template is the baseline,
-        state = (
-            dataclasses.replace(self.ctx.state_template) if self.ctx.state_template else State()
-        )
+        #  -> so we overwrite and warn on conflict: state_template is the baseline.
+        # State is frozen, so the template can be used as-is: the replace() below
+        # produces the new instance and nothing mutates the original.
+        state = self.ctx.state_template or _EMPTY_STATE
 
-        relations = self._generate_relations_state(
+        # relation is the Relation instance this test is about:
+        relations, relation = self._generate_relations_state(
             state, input_state, self.ctx.supported_endpoints, self.ctx.role
         )
         # State is frozen; replace
         modified_state = dataclasses.replace(state, relations=relations)
 
-        # the Relation instance this test is about:
-        relation = next(filter(lambda r: r.interface == self.ctx.interface_name, relations))
         evt: _Event = self._cast_event(event, relation)
 
-        logger.info("collected test for %s with %s" % (self.ctx.interface_name, evt.name))
+        logger.info("collected test for %s with %s", self.ctx.interface_name, evt.name)
         return self._run_scenario(evt, modified_state)
 
     def _run_scenario(self, event: Union[str, _Event], state: State):
-        logger.debug("running scenario with state=%s, event=%s" % (state, event))
+        logger.debug("running scenario with state=%s, event=%s", state, event)
 
         kwargs = {}
         if self.ctx.juju_version:
@@ -412,7 +449,11 @@ class Tester:
             config=self.ctx.config,
             **kwargs,
         )
-        return ctx.run(event, state)
+        # scenario's runtime mutates process-wide state (env vars, patches) and is not
+        # re-entrant: only one scenario run may be in flight at a time, even when the
+        # surrounding test cases execute in parallel threads.
+        with _SCENARIO_RUN_LOCK:
+            return ctx.run(event, state)
 
     def _cast_event(self, raw_event: Union[str, _Event], relation: Relation):
         if not isinstance(raw_event, (_Event, str)):
@@ -422,20 +463,15 @@ class Tester:
             )
 
         if isinstance(raw_event, str):
-            if raw_event.endswith("-relation-changed"):
-                event = CharmEvents.relation_changed(relation)
-            elif raw_event.endswith("-relation-departed"):
-                event = CharmEvents.relation_departed(relation)
-            elif raw_event.endswith("-relation-broken"):
-                event = CharmEvents.relation_broken(relation)
-            elif raw_event.endswith("-relation-joined"):
-                event = CharmEvents.relation_joined(relation)
-            elif raw_event.endswith("-relation-created"):
-                event = CharmEvents.relation_created(relation)
-            else:
+            # single scan instead of one endswith per relation event kind; the separator check
+            # short-circuits non-relation events before the suffix lookup.
+            _, sep, suffix = raw_event.rpartition("-relation-")
+            ctor = _RELATION_EVENT_CONSTRUCTORS.get(suffix) if sep else None
+            if ctor is None:
                 raise InvalidTestCaseError(
                     f"Bad interface test specification: event {raw_event} is not a relation event."
                 )
+            event = ctor(relation)
         else:
             event = raw_event
 
@@ -472,12 +508,14 @@ class Tester:
 
     def _generate_relations_state(
         self, state_template: State, input_state: State, supported_endpoints, role: Role
-    ) -> List[Relation]:
+    ) -> Tuple[List[Relation], Relation]:
         """Merge the relations from the input state and the state template into one.
 
         The charm being tested possibly provided a state_template to define some setup mocking data
         The interface tests also have an input_state. Here we merge them into one relation list to
         be passed to the 'final' State the test will run with.
+
+        Returns the merged relation list along with the relation this test is about.
         """
         interface_name = self.ctx.interface_name
 
@@ -492,54 +530,60 @@ class Tester:
                 logger.warning(
                     "relation with interface name =%s found in state template. "
                     "This will be overwritten by the relation spec provided by the relation "
-                    "interface test case." % interface_name
+                    "interface test case.",
+                    interface_name,
                 )
 
-        def filter_relations(rels: List[Relation], op: Callable):
-            return [r for r in rels if op(r.interface, interface_name)]
-
         # the baseline is: all relations provided by the charm in the state_template,
         # whose interface IS NOT the interface we're testing. We assume the test (input_state) is
         # the ultimate owner of the state when it comes to the interface we're testing.
         # We don't allow the charm to mess with it.
-        relations = filter_relations(state_template.relations, op=operator.ne)
+        relations = [r for r in state_template.relations if r.interface != interface_name]
+        interface_relation: Optional[Relation] = None
 
         if input_state:
             # if the interface test we're running specified some relations in its input_state,
             # we add those whose interface IS the same as the one we're testing.
             # If other relation interfaces were specified (for whatever reason?),
-            # they will be ignored.
-            relations_from_input_state = filter_relations(input_state.relations, op=operator.eq)
+            # they will be ignored. Partition in a single pass.
+            matching: List[Relation] = []
+            ignored: List[Relation] = []
+            for r in input_state.relations:
+                (matching if r.interface == interface_name else ignored).append(r)
 
             # relations that come from the state_template presumably have the right endpoint,
             # but those that we get from interface tests cannot.
-            relations_with_endpoint = [
-                dataclasses.replace(r, endpoint=endpoint) for r in relations_from_input_state
-            ]
+            matching_with_endpoint = [dataclasses.replace(r, endpoint=endpoint) for r in matching]
+            relations.extend(matching_with_endpoint)
+            if matching_with_endpoint:
+                interface_relation = matching_with_endpoint[0]
 
-            relations.extend(relations_with_endpoint)
-
-            if ignored := filter_relations(input_state.relations, op=operator.ne):
+            if ignored:
                 # this is a sign of a bad test.
                 logger.warning(
                     "irrelevant relations specified in input_state for %s/%s."
-                    "These will be ignored. details: %s" % (interface_name, role, ignored)
+                    "These will be ignored. details: %s",
+                    interface_name,
+                    role,
+                    ignored,
                 )
 
         # if we still don't have any relation matching the interface we're testing, we generate
         # one from scratch.
-        if not filter_relations(relations, op=operator.eq):
+        if interface_relation is None:
             # if neither the charm nor the interface specified any custom relation spec for
             # the interface we're testing, we will provide one.
-            relations.append(
-                Relation(
-                    interface=interface_name,
-                    endpoint=endpoint,
-                )
+            interface_relation = Relation(
+                interface=interface_name,
+                endpoint=endpoint,
             )
+            relations.append(interface_relation)
         logger.debug(
-            "%s: merged %s and %s --> relations=%s"
-            % (self, input_state, state_template, relations)
+            "%s: merged %s and %s --> relations=%s",
+            self,
+            input_state,
+            state_template,
+            relations,
         )
 
-        return relations
+        return relations, interface_relation
@@ -1,10 +1,19 @@
 # Copyright 2022 Canonical Ltd.
 # See LICENSE file for licensing details.
+import asyncio
+import atexit
+import hashlib
 import logging
+import os
+import shutil
+import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from subprocess import PIPE, Popen
-from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, Generator, List, Optional, Set, Tuple, Type
 
 from ops.testing import CharmType
 from scenario import State
@@ -28,6 +37,244 @@ ROLE_TO_ROLE_META = {"provider": "provides", "requirer": "requires"}
 
 logger = logging.getLogger("pytest_interface_tester")
 
+# Clones of the charm-relation-interfaces repo are cached process-wide, keyed by (repo, branch),
+# so that a test session instantiating many InterfaceTesters only pays for the network round trip
+# and the git subprocess once. A cached clone older than this many seconds is refreshed with a
+# fetch before being reused.
+_CLONE_MAX_AGE_SECONDS = 300
+_REPO_CACHE: Dict[Tuple[str, str], Path] = {}
+# serializes disk mutations per (repo, branch): distinct repos clone concurrently, while
+# two callers racing for the same clone wait on each other instead of trampling the dir.
+_CLONE_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+# guards the cache dicts themselves.
+_REPO_CACHE_LOCK = threading.Lock()
+
+# Gathered test specs are deterministic in (repo, branch, base_path, interface name, version),
+# so we memoize them as well: repeat run() calls with the same configuration skip the
+# yaml-parsing and test-module-importing work entirely. A memoized spec is only re-gathered
+# after a stale-clone refresh drops it (see _ensure_repo_clone), which in turn only happens
+# when some collection misses this cache and touches the clone.
+_SPEC_CACHE: Dict[Tuple[str, str, str, str, int], InterfaceTestSpec] = {}
+
+# Per-clone index of which interface versions a checkout ships, built with one os.scandir
+# sweep so that repeat spec collections don't stat the interface dir over and over.
+# Keyed by (clone dir, base_path); values map interface dir name -> available versions.
+_VERSIONS_CACHE: Dict[Tuple[str, str], Dict[str, Set[int]]] = {}
+
+# _CharmSpec.autoload walks the filesystem looking for metadata.yaml and parses it; the result
+# is invariant in the charm type, so it is shared between all InterfaceTester instances rather
+# than re-computed by each per-function fixture. Specs built from explicitly-provided meta are
+# cheap and only cached per instance (by the _charm_spec descriptor).
+_CHARM_SPEC_CACHE: Dict[Type[CharmType], _CharmSpec] = {}
+
+
+def _clear_repo_cache():
+    """Remove all cached clones from disk and forget about them."""
+    with _REPO_CACHE_LOCK:
+        for clone_dir in _REPO_CACHE.values():
+            shutil.rmtree(clone_dir, ignore_errors=True)
+        _REPO_CACHE.clear()
+        _VERSIONS_CACHE.clear()
+        _CLONE_LOCKS.clear()
+
+
+atexit.register(_clear_repo_cache)
+
+
+# never prompt for credentials (a hung git would stall the whole session) and don't
+# smudge LFS blobs: the collector only reads text specs.
+_GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_LFS_SKIP_SMUDGE": "1"}
+
+
+def _git(args: List[str], cwd: Path = None):
+    """Run a git command; raise RuntimeError on nonzero exit."""
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, env=_GIT_ENV, capture_output=True, check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"git {' '.join(args)} failed; out={result.stdout!r} err={result.stderr!r}"
+        )
+
+
+def _invalidate_versions_cache(clone_dir: Path):
+    """Forget the version index for a clone whose contents just changed."""
+    clone_key = str(clone_dir)
+    for key in [k for k in _VERSIONS_CACHE if k[0] == clone_key]:
+        del _VERSIONS_CACHE[key]
+
+
+def _invalidate_spec_cache(repo: str, branch: str):
+    """Forget the memoized specs gathered from a clone whose contents just changed."""
+    for key in [k for k in _SPEC_CACHE if k[0] == repo and k[1] == branch]:
+        del _SPEC_CACHE[key]
+
+
+def _available_versions(clone_dir: Path, base_path: str) -> Dict[str, Set[int]]:
+    """Map each interface dir under ``clone_dir/base_path`` to the versions it ships.
+
+    The index is built with a single os.scandir sweep per clone and cached, so checking
+    whether a spec dir exists costs a dict lookup instead of a stat on every collection.
+    """
+    key = (str(clone_dir), base_path)
+    cached = _VERSIONS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    index: Dict[str, Set[int]] = {}
+    base = clone_dir / base_path
+    if base.exists():
+        with os.scandir(base) as interface_dirs:
+            for interface_dir in interface_dirs:
+                if not interface_dir.is_dir():
+                    continue
+                versions: Set[int] = set()
+                with os.scandir(interface_dir.path) as version_dirs:
+                    for version_dir in version_dirs:
+                        if version_dir.is_dir() and version_dir.name.startswith("v"):
+                            try:
+                                versions.add(int(version_dir.name[1:]))
+                            except ValueError:
+                                continue
+                index[interface_dir.name] = versions
+
+    _VERSIONS_CACHE[key] = index
+    return index
+
+
+def _clone_repo(repo: str, branch: str, target: Path):
+    """Shallow-clone ``repo`` at ``branch`` into ``target``.
+
+    If dulwich is installed, the clone runs in-process, skipping the fork/exec of a git
+    subprocess; otherwise we fall back to the git CLI.
+    """
+    try:
+        from dulwich import porcelain
+    except ImportError:
+        # --single-branch limits ref negotiation to the branch we want; --filter=blob:none
+        # defers blobs we never open to lazy promisor fetches.
+        _git(
+            [
+                "clone",
+                "--depth",
+                "1",
+                "--single-branch",
+                "--filter=blob:none",
+                "--branch",
+                branch,
+                repo,
+                str(target),
+            ]
+        )
+        return
+
+    try:
+        # NoneStream keeps dulwich's pack progress out of the pytest output.
+        porcelain.clone(
+            repo,
+            target=str(target),
+            depth=1,
+            branch=branch.encode(),
+            errstream=porcelain.NoneStream(),
+        )
+    except Exception as e:
+        # dulwich raises its own error types; normalize to the RuntimeError the
+        # caller wraps with the check-your-ref message.
+        raise RuntimeError(f"dulwich clone of {repo}@{branch} failed: {e}") from e
+
+
+def _clone_cache_dir(repo: str, branch: str) -> Path:
+    """The directory a clone of ``repo`` at ``branch`` is cached in."""
+    key = hashlib.sha1(f"{repo}@{branch}".encode()).hexdigest()
+    return Path(tempfile.gettempdir()) / "pytest-interface-tester" / key
+
+
+def _clone_lock(repo: str, branch: str) -> threading.Lock:
+    """The lock guarding the on-disk clone of ``repo`` at ``branch``."""
+    with _REPO_CACHE_LOCK:
+        return _CLONE_LOCKS.setdefault((repo, branch), threading.Lock())
+
+
+def _ensure_repo_clone(repo: str, branch: str) -> Path:
+    """Return the path of a local clone of ``repo`` at ``branch``, cloning on cache miss.
+
+    On a hit, the cached clone is returned as-is (no subprocess spawned) unless it is older
+    than ``_CLONE_MAX_AGE_SECONDS``, in which case it is refreshed with a shallow fetch first.
+    Distinct (repo, branch) pairs can clone concurrently; callers racing for the same pair
+    serialize on its clone lock.
+    """
+    with _clone_lock(repo, branch):
+        with _REPO_CACHE_LOCK:
+            cached = _REPO_CACHE.get((repo, branch))
+        if cached and cached.exists():
+            if time.time() - cached.stat().st_mtime > _CLONE_MAX_AGE_SECONDS:
+                logger.info(f"cached clone of {repo}@{branch} is stale; fetching")
+                _git(["-C", str(cached), "fetch", "--depth", "1", "origin", branch])
+                _git(["-C", str(cached), "reset", "--hard", "FETCH_HEAD"])
+                cached.touch()
+                with _REPO_CACHE_LOCK:
+                    _invalidate_versions_cache(cached)
+                    _invalidate_spec_cache(repo, branch)
+            return cached
+
+        clone_dir = _clone_cache_dir(repo, branch)
+        if clone_dir.exists():
+            # left over from a previous process; start from scratch.
+            shutil.rmtree(clone_dir)
+        clone_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"cloning {repo}@{branch} into {clone_dir}")
+        try:
+            _clone_repo(repo, branch, clone_dir)
+        except RuntimeError as e:
+            raise RuntimeError(
+                f"failed to fetch {repo}:{branch}, check that the ref is correct. {e}"
+            ) from e
+
+        with _REPO_CACHE_LOCK:
+            _invalidate_versions_cache(clone_dir)
+            _REPO_CACHE[(repo, branch)] = clone_dir
+        return clone_dir
+
+
+class _SessionCache:
+    """Shares git clones and gathered test specs between testers.
+
+    A thin facade over the module-level caches: owning it in a session-scoped pytest
+    fixture ties the cache lifetime to the test session, so cleanup happens when the
+    session ends instead of at interpreter exit.
+    """
+
+    def get_or_clone(self, repo: str, branch: str) -> Path:
+        return _ensure_repo_clone(repo, branch)
+
+    def get_spec(self, key: Tuple[str, str, str, str, int]) -> Optional[InterfaceTestSpec]:
+        return _SPEC_CACHE.get(key)
+
+    def put_spec(self, key: Tuple[str, str, str, str, int], spec: InterfaceTestSpec):
+        _SPEC_CACHE[key] = spec
+
+    def cleanup(self):
+        _SPEC_CACHE.clear()
+        _CHARM_SPEC_CACHE.clear()
+        _clear_repo_cache()
+
+
+# default cache for testers instantiated outside the interface_tester fixture.
+_PROCESS_CACHE = _SessionCache()
+
+# (attribute, predicate, error message) table driving the simple _validate_config checks.
+_REQUIRED_CONFIG = (
+    ("_charm_type", bool, "Tester misconfigured: needs a charm_type set."),
+    ("_repo", bool, "repo missing"),
+    ("_interface_name", bool, "interface_name missing"),
+    (
+        "_interface_version",
+        lambda version: isinstance(version, int),
+        "interface_version should be an integer",
+    ),
+)
+
 
 class InterfaceTester:
     _RAISE_IMMEDIATELY = False
@@ -49,11 +296,13 @@ class InterfaceTester:
         self._config = None
         self._endpoint = None
         self._interface_name = None
+        self._interface_name_normalized = None
         self._interface_version = 0
         self._juju_version = None
         self._state_template = None
 
-        self._charm_spec_cache = None
+        # set by the interface_tester fixture; defaults to the process-wide cache.
+        self._session_cache = _PROCESS_CACHE
 
     def configure(
         self,
@@ -103,6 +352,9 @@ class InterfaceTester:
             self._endpoint = endpoint
         if interface_name:
             self._interface_name = interface_name
+            # the directory name in the interfaces repo; resolved once here instead of
+            # per _collect_interface_test_specs call.
+            self._interface_name_normalized = interface_name.replace("-", "_")
         if interface_version is not None:
             self._interface_version = interface_version
         if state_template:
@@ -114,26 +366,27 @@ class InterfaceTester:
         if juju_version:
             self._juju_version = juju_version
 
+        # the charm metadata may have changed: drop the derived endpoint index and the
+        # cached charm spec.
+        self.__dict__.pop("_endpoints_by_interface", None)
+        self.__dict__.pop("_charm_spec", None)
+
     def _validate_config(self):
         """Validate the configuration of the tester.
 
         Will raise InterfaceTesterValidationError if something is not right with the config.
         """
-        errors = []
+        errors = [
+            message
+            for attr, predicate, message in _REQUIRED_CONFIG
+            if not predicate(getattr(self, attr))
+        ]
         if (self._actions or self._config) and not self._meta:
             errors.append(
                 "Tester misconfigured: cannot set actions and config without setting meta."
             )
-        if not self._charm_type:
-            errors.append("Tester misconfigured: needs a charm_type set.")
-        elif not self.meta:
+        if self._charm_type and not self.meta:
             errors.append("no metadata: it was not provided, and it cannot be autoloaded")
-        if not self._repo:
-            errors.append("repo missing")
-        if not self._interface_name:
-            errors.append("interface_name missing")
-        if not isinstance(self._interface_version, int):
-            errors.append("interface_version should be an integer")
         if self._state_template and not isinstance(self._state_template, State):
             errors.append(
                 f"state_template should be of type State, " f"not: {type(self._state_template)}"
@@ -145,31 +398,37 @@ class InterfaceTester:
                 f"please use the configure() API to provide the missing pieces."
             )
 
-    @property
+    @cached_property
     def _charm_spec(self) -> _CharmSpec:
-        """Return the _CharmSpec object representing the tested charm and its metadata."""
-        if not self._charm_spec_cache:
-            # We try to use Scenario's internal autoload functionality to autoload the charm spec.
-            try:
-                spec = _CharmSpec.autoload(self._charm_type)
-                # if no metadata.yaml can be found in the charm type module's parent directory,
-                # this call will raise:
-            except MetadataNotFoundError as e:
-                # if we have _meta set, we're good, otherwise we're misconfigured.
-                if self._meta and self._charm_type:
-                    spec = _CharmSpec(
-                        meta=self._meta,
-                        actions=self._actions,
-                        config=self._config,
-                        charm_type=self._charm_type,
-                    )
-                else:
-                    raise InterfaceTesterValidationError(
-                        "This InterfaceTester is missing charm metadata `meta` or a `charm type`. "
-                        "Unable to load charm spec. Please provide both using the `configure` API."
-                    ) from e
-            self._charm_spec_cache = spec
-        return self._charm_spec_cache
+        """Return the _CharmSpec object representing the tested charm and its metadata.
+
+        The descriptor caches per instance after the first access; the module-level cache
+        shares the autoload result between instances of the same charm type.
+        """
+        cached = _CHARM_SPEC_CACHE.get(self._charm_type)
+        if cached is not None:
+            return cached
+
+        # We try to use Scenario's internal autoload functionality to autoload the charm spec.
+        try:
+            spec = _CharmSpec.autoload(self._charm_type)
+            # if no metadata.yaml can be found in the charm type module's parent directory,
+            # this call will raise:
+        except MetadataNotFoundError as e:
+            # if we have _meta set, we're good, otherwise we're misconfigured.
+            if self._meta and self._charm_type:
+                return _CharmSpec(
+                    meta=self._meta,
+                    actions=self._actions,
+                    config=self._config,
+                    charm_type=self._charm_type,
+                )
+            raise InterfaceTesterValidationError(
+                "This InterfaceTester is missing charm metadata `meta` or a `charm type`. "
+                "Unable to load charm spec. Please provide both using the `configure` API."
+            ) from e
+        _CHARM_SPEC_CACHE[self._charm_type] = spec
+        return spec
 
     @property
     def meta(self) -> dict:
@@ -188,74 +447,108 @@ class InterfaceTester:
 
     def _collect_interface_test_specs(self) -> InterfaceTestSpec:
         """Gathers the test cases as defined by charm-relation-interfaces, for both roles."""
-        with tempfile.TemporaryDirectory() as tempdir:
-            cmd = f"git clone --depth 1 --branch {self._branch} {self._repo}".split(" ")
-            proc = Popen(cmd, cwd=tempdir, stderr=PIPE, stdout=PIPE)
-            proc.wait()
-            if proc.returncode != 0:
-                raise RuntimeError(
-                    f"failed to fetch {self._repo}:{self._branch}, "
-                    f"check that the ref is correct. "
-                    f"out={proc.stdout.read()}"
-                    f"err={proc.stderr.read()}"
-                )
+        cache = self._session_cache
+        key = (
+            self._repo,
+            self._branch,
+            self._base_path,
+            self._interface_name,
+            self._interface_version,
+        )
+        cached = cache.get_spec(key)
+        if cached is not None:
+            return cached
+
+        clone_dir = cache.get_or_clone(self._repo, self._branch)
+
+        intf_spec_path = (
+            clone_dir
+            / self._base_path
+            / self._interface_name_normalized
+            / f"v{self._interface_version}"
+        )
+        available = _available_versions(clone_dir, self._base_path)
+        if self._interface_version not in available.get(self._interface_name_normalized, ()):
+            raise RuntimeError(
+                f"interface spec dir not found at expected location. "
+                f"Check that {intf_spec_path} is a valid path in the remote repo you've "
+                f"selected as test case source for this run."
+            )
 
-            repo_name = self._repo.split("/")[-1]
-            if repo_name.endswith(".git"):
-                repo_name = repo_name.rsplit(".", maxsplit=1)[0]
+        tests = gather_test_spec_for_version(
+            intf_spec_path,
+            interface_name=self._interface_name,
+            version=self._interface_version,
+        )
+        cache.put_spec(key, tests)
+        return tests
 
-            intf_spec_path = (
-                Path(tempdir)
-                / repo_name
-                / self._base_path
-                / self._interface_name.replace("-", "_")
-                / f"v{self._interface_version}"
-            )
-            if not intf_spec_path.exists():
-                raise RuntimeError(
-                    f"interface spec dir not found at expected location. "
-                    f"Check that {intf_spec_path} is a valid path in the remote repo you've "
-                    f"selected as test case source for this run."
-                )
+    @classmethod
+    async def _collect_many(cls, testers: List["InterfaceTester"]):
+        """Warm the clone and spec caches for several testers concurrently.
 
-            tests = gather_test_spec_for_version(
-                intf_spec_path,
-                interface_name=self._interface_name,
-                version=self._interface_version,
-            )
+        All missing clones are issued at once in executor threads (distinct repos only
+        serialize on their own clone lock); each tester's spec is then gathered as soon as
+        its clone has landed, overlapping the parse work with the clones still in flight.
+        Parsing itself runs one spec at a time because the collector mutates ``sys.path``
+        and ``sys.modules``.
+        """
+        loop = asyncio.get_running_loop()
 
-        return tests
+        clone_tasks: Dict[Tuple[str, str], "asyncio.Future"] = {}
+        for tester in testers:
+            clone_key = (tester._repo, tester._branch)
+            if clone_key not in clone_tasks:
+                clone_tasks[clone_key] = loop.run_in_executor(None, _ensure_repo_clone, *clone_key)
+
+        for tester in testers:
+            await clone_tasks[(tester._repo, tester._branch)]
+            await loop.run_in_executor(None, tester._collect_interface_test_specs)
+
+    @classmethod
+    def warm_up(cls, testers: List["InterfaceTester"]):
+        """Pre-populate the clone and spec caches for several configured testers at once.
+
+        Call this (e.g. from a session-scoped fixture) before the individual tests run, to
+        overlap the network-bound clones with the cpu-bound spec parsing instead of paying
+        for them serially inside each test.
+        """
+        asyncio.run(cls._collect_many(list(testers)))
+
+    @cached_property
+    def _endpoints_by_interface(self) -> Dict[str, Dict[RoleLiteral, List[str]]]:
+        """Inverted index of the charm's endpoints: interface name -> role -> endpoint names.
+
+        Built in a single pass over the charm's metadata.yaml; assuming there's been a
+        _validate_config() before this point, it's safe to access `meta`.
+        """
+        idx: Dict[str, Dict[RoleLiteral, List[str]]] = {}
+        for role, meta_role in ROLE_TO_ROLE_META.items():
+            for endpoint, endpoint_spec in self.meta.get(meta_role, {}).items():
+                idx.setdefault(endpoint_spec["interface"], {}).setdefault(role, []).append(
+                    endpoint
+                )
+        return idx
 
     def _gather_supported_endpoints(self) -> Dict[RoleLiteral, List[str]]:
         """Given a relation interface name, return a list of supported endpoints as either role.
 
         These are collected from the charm's metadata.yaml.
         """
-        supported_endpoints: Dict["RoleLiteral", List[str]] = {}
+        # if there are no endpoints using this interface, this means that this charm does not
+        # support that role in the relation. There MIGHT still be tests for the other role, but
+        # they are then meant for a charm implementing the other role.
+        supported_endpoints = self._endpoints_by_interface.get(self._interface_name, {})
         role: RoleLiteral
         for role in ("provider", "requirer"):
-            meta_role = ROLE_TO_ROLE_META[role]
-
-            # assuming there's been a _validate_config() before this point, it's safe to access
-            # `meta`.
-            endpoints = self.meta.get(meta_role, {})
-            # if there are no endpoints using this interface, this means that this charm does not
-            # support that role in the relation. There MIGHT still be tests for the other role, but
-            # they are then meant for a charm implementing the other role.
-
-            endpoints_for_interface = [
-                k for k, v in endpoints.items() if v["interface"] == self._interface_name
-            ]
-
-            if endpoints_for_interface:
-                supported_endpoints[role] = endpoints_for_interface
-            else:
-                logger.warning(f"skipping role {role}: unsupported by this charm.")
+            if role not in supported_endpoints:
+                logger.warning("skipping role %s: unsupported by this charm.", role)
 
         return supported_endpoints
 
     def _yield_tests(
         self,
+        supported_endpoints: Optional[Dict[RoleLiteral, List[str]]] = None,
     ) -> Generator[Tuple[Callable, RoleLiteral, DataBagSchema], None, None]:
         """Yield all test cases applicable to this charm and interface.
 
@@ -279,49 +572,81 @@ class InterfaceTester:
             yield from ()
             return
 
-        supported_endpoints = self._gather_supported_endpoints()
+        if supported_endpoints is None:
+            supported_endpoints = self._gather_supported_endpoints()
         if not supported_endpoints:
             raise RuntimeError(f"this charm does not declare any endpoint using {interface_name}.")
 
         role: RoleLiteral
         for role, endpoints in supported_endpoints.items():
-            logger.debug(f"collecting scenes for {role}")
+            logger.debug("collecting scenes for %s", role)
+
+            # the endpoint filter is invariant across tests: apply it once per role.
+            if self._endpoint:
+                for endpoint in endpoints:
+                    if endpoint != self._endpoint:
+                        logger.debug("skipped compatible endpoint %s", endpoint)
+                endpoints = [ep for ep in endpoints if ep == self._endpoint]
 
             spec = tests[role]
             schema = spec["schema"]
             for test in spec["tests"]:
                 for endpoint in endpoints:
-                    if self._endpoint and endpoint != self._endpoint:
-                        logger.debug(f"skipped compatible endpoint {endpoint}")
-                        continue
                     yield test, role, schema, endpoint
 
     def __repr__(self):
-        return f"""<Interface Tester: 
+        # meta/actions/config can be large dicts: only show their keys.
+        def _summarize(obj: Any):
+            return sorted(obj) if isinstance(obj, dict) else obj
+
+        return f"""<Interface Tester:
         \trepo={self._repo}
         \tbranch={self._branch}
         \tbase_path={self._base_path}
         \tcharm_type={self._charm_type}
-        \tmeta={self._meta}
-        \tactions={self._actions}
-        \tconfig={self._config}
+        \tmeta={_summarize(self._meta)}
+        \tactions={_summarize(self._actions)}
+        \tconfig={_summarize(self._config)}
         \tinterface_name={self._interface_name}
         \tinterface_version={self._interface_version}
         \tjuju_version={self._juju_version}
         \tstate_template={self._state_template}>"""
 
-    def run(self) -> bool:
+    def _run_test_case(self, ctx: _InterfaceTestContext) -> Optional[Exception]:
+        """Run a single test case; return the exception it raised, if any."""
+        try:
+            with tester_context(ctx):
+                ctx.test_fn()
+        except Exception as e:
+            logger.exception(f"Interface tester plugin failed with {e}")
+
+            if self._RAISE_IMMEDIATELY:
+                raise e
+
+            return e
+        return None
+
+    def run(self, parallel: bool = False) -> bool:
         """Run interface tests.
 
+        Pass ``parallel=True`` to execute the test cases concurrently in a thread pool.
+        This is opt-in: the interface test functions come from charm-relation-interfaces
+        and are not guaranteed to be thread-safe, and the scenario invocation itself is
+        serialized regardless (scenario's runtime is not re-entrant).
+
         Returns True if some tests were found and ran, False otherwise.
         """
         self._validate_config()  # will raise if misconfigured
-        logger.info(f"Running {repr(self)}.")
-        errors = []
-        ran_some = False
+        logger.info("Running %r.", self)
+
+        # invariant across all test cases: look them up once instead of per-context.
+        meta = self.meta
+        config = self.config
+        actions = self.actions
+        supported_endpoints = self._gather_supported_endpoints()
 
-        for test_fn, role, schema, endpoint in self._yield_tests():
-            ctx = _InterfaceTestContext(
+        contexts = [
+            _InterfaceTestContext(
                 role=role,
                 schema=schema,
                 interface_name=self._interface_name,
@@ -329,24 +654,30 @@ class InterfaceTester:
                 version=self._interface_version,
                 charm_type=self._charm_type,
                 state_template=self._state_template,
-                meta=self.meta,
-                config=self.config,
-                actions=self.actions,
-                supported_endpoints=self._gather_supported_endpoints(),
+                meta=meta,
+                config=config,
+                actions=actions,
+                supported_endpoints=supported_endpoints,
                 test_fn=test_fn,
                 juju_version=self._juju_version,
             )
-            try:
-                with tester_context(ctx):
-                    test_fn()
-            except Exception as e:
-                logger.exception(f"Interface tester plugin failed with {e}")
-
-                if self._RAISE_IMMEDIATELY:
-                    raise e
+            for test_fn, role, schema, endpoint in self._yield_tests(supported_endpoints)
+        ]
+        ran_some = bool(contexts)
+        errors = []
 
-                errors.append((ctx, e))
-            ran_some = True
+        if parallel and len(contexts) > 1:
+            with ThreadPoolExecutor() as pool:
+                futures = [(ctx, pool.submit(self._run_test_case, ctx)) for ctx in contexts]
+                for ctx, future in futures:
+                    e = future.result()  # re-raises if _RAISE_IMMEDIATELY fired
+                    if e:
+                        errors.append((ctx, e))
+        else:
+            for ctx in contexts:
+                e = self._run_test_case(ctx)
+                if e:
+                    errors.append((ctx, e))
 
         # todo: consider raising custom exceptions here.
         if errors:
@@ -0,0 +1,195 @@
+import os
+import shutil
+import subprocess
+import time
+from textwrap import dedent
+
+import pytest
+from ops import CharmBase
+from utils import CRI_LIKE_PATH
+
+import interface_tester
+from interface_tester import InterfaceTester
+from interface_tester.collector import gather_test_spec_for_version
+from interface_tester.errors import InterfaceTestsFailed
+from interface_tester.plugin import (
+    _REPO_CACHE,
+    _SPEC_CACHE,
+    _clear_repo_cache,
+    _ensure_repo_clone,
+)
+
+
+class DummiCharm(CharmBase):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    """Isolate the module-level caches between tests."""
+    _clear_repo_cache()
+    _SPEC_CACHE.clear()
+    yield
+    _clear_repo_cache()
+    _SPEC_CACHE.clear()
+
+
+def _git(*args, cwd):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@test", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def local_interfaces_repo(tmp_path):
+    """A local git repo with the same layout as charm-relation-interfaces."""
+    repo = tmp_path / "charm-relation-interfaces"
+    shutil.copytree(CRI_LIKE_PATH, repo)
+    _git("init", "-b", "main", cwd=repo)
+    _git("add", ".", cwd=repo)
+    _git("commit", "-m", "init", cwd=repo)
+    yield str(repo)
+
+
+def test_ensure_repo_clone_miss_then_hit(local_interfaces_repo, monkeypatch):
+    clone_dir = _ensure_repo_clone(local_interfaces_repo, "main")
+    assert (clone_dir / "interfaces" / "database" / "v1").exists()
+
+    def _explode(*args, **kwargs):
+        raise AssertionError("a cache hit should not re-clone")
+
+    monkeypatch.setattr("interface_tester.plugin._clone_repo", _explode)
+    assert _ensure_repo_clone(local_interfaces_repo, "main") == clone_dir
+
+
+def test_ensure_repo_clone_stale_refresh(local_interfaces_repo):
+    clone_dir = _ensure_repo_clone(local_interfaces_repo, "main")
+
+    new_file = "added-after-clone.txt"
+    with open(os.path.join(local_interfaces_repo, new_file), "w") as f:
+        f.write("hello")
+    _git("add", ".", cwd=local_interfaces_repo)
+    _git("commit", "-m", "update", cwd=local_interfaces_repo)
+
+    # a fresh clone is not refreshed: the new commit is not visible yet.
+    _ensure_repo_clone(local_interfaces_repo, "main")
+    assert not (clone_dir / new_file).exists()
+
+    # age the clone past the staleness threshold to force a fetch + reset.
+    old = time.time() - 3600
+    os.utime(clone_dir, (old, old))
+    _ensure_repo_clone(local_interfaces_repo, "main")
+    assert (clone_dir / new_file).exists()
+
+
+def test_warm_up_populates_caches(local_interfaces_repo):
+    testers = []
+    for interface_name, version in (("database", 1), ("tracing", 42)):
+        tester = InterfaceTester(repo=local_interfaces_repo, branch="main")
+        tester.configure(interface_name=interface_name, interface_version=version)
+        testers.append(tester)
+
+    InterfaceTester.warm_up(testers)
+
+    assert (local_interfaces_repo, "main") in _REPO_CACHE
+    for interface_name, version in (("database", 1), ("tracing", 42)):
+        assert (
+            local_interfaces_repo,
+            "main",
+            "interfaces",
+            interface_name,
+            version,
+        ) in _SPEC_CACHE
+
+
+def _tracing_tester_with_test_file(test_file: str, tmp_path):
+    pth = tmp_path / "interfaces" / "tracing" / "v42"
+    test_dir = pth / "interface_tests"
+    test_dir.mkdir(parents=True)
+    (test_dir / "test_provider.py").write_text(dedent(test_file))
+
+    class TempDirTester(InterfaceTester):
+        def _collect_interface_test_specs(self):
+            return gather_test_spec_for_version(
+                pth,
+                interface_name=self._interface_name,
+                version=self._interface_version,
+            )
+
+    tester = TempDirTester()
+    tester.configure(
+        charm_type=DummiCharm,
+        meta={"name": "dummi", "provides": {"dead": {"interface": "tracing"}}},
+        interface_name="tracing",
+        interface_version=42,
+    )
+    return tester
+
+
+FAILING_TESTS = """
+from scenario import State
+
+from interface_tester.interface_test import Tester
+
+def test_one():
+    t = Tester(State())
+    t.run("tracing-relation-joined")
+    t.skip_schema_validation()
+    raise RuntimeError("boom-1")
+
+def test_two():
+    t = Tester(State())
+    t.run("tracing-relation-joined")
+    t.skip_schema_validation()
+    raise RuntimeError("boom-2")
+"""
+
+
+@pytest.mark.parametrize("parallel", (True, False))
+def test_run_aggregates_errors(parallel, tmp_path):
+    tester = _tracing_tester_with_test_file(FAILING_TESTS, tmp_path)
+    with pytest.raises(InterfaceTestsFailed) as e:
+        tester.run(parallel=parallel)
+    assert "2 errors" in str(e.value)
+
+
+PASSING_TESTS = """
+from scenario import State
+
+from interface_tester.interface_test import Tester
+
+def test_one():
+    t = Tester(State())
+    t.run("tracing-relation-joined")
+    t.skip_schema_validation()
+
+def test_two():
+    t = Tester(State())
+    t.run("tracing-relation-changed")
+    t.skip_schema_validation()
+"""
+
+
+@pytest.mark.parametrize("parallel", (True, False))
+def test_run_parallel_ok(parallel, tmp_path):
+    tester = _tracing_tester_with_test_file(PASSING_TESTS, tmp_path)
+    tester.run(parallel=parallel)
+
+
+def test_session_cache_fixture_wiring():
+    # drive the fixture generators by hand: the interface_tester fixture should wire the
+    # session cache into the tester it yields.
+    cache_gen = interface_tester.interface_tester_session_cache.__wrapped__()
+    cache = next(cache_gen)
+
+    tester_gen = interface_tester.interface_tester.__wrapped__(cache)
+    tester = next(tester_gen)
+    assert tester._session_cache is cache
+
+    # cleanup (run when the session fixture finalizes) empties the spec cache.
+    _SPEC_CACHE[("r", "b", "p", "i", 0)] = {}
+    cache.cleanup()
+    assert not _SPEC_CACHE